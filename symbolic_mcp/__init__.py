@@ -39,6 +39,7 @@ from symbolic_mcp.security import (
     BLOCKED_MODULES,
     DANGEROUS_BUILTINS,
     _DangerousCallVisitor,
+    _parse_and_validate,
     validate_code,
 )
 
@@ -109,6 +110,7 @@ __all__ = [
     "BLOCKED_MODULES",
     "DANGEROUS_BUILTINS",
     "_DangerousCallVisitor",
+    "_parse_and_validate",
     # Config
     "DEFAULT_ANALYSIS_TIMEOUT_SECONDS",
     "MEMORY_LIMIT_MB",
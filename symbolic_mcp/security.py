@@ -8,7 +8,11 @@ dangerous code patterns, and the main validation function.
 """
 
 import ast
+import re
 import textwrap
+from collections import deque
+from collections.abc import Callable
+from typing import Any
 
 from symbolic_mcp.config import CODE_SIZE_LIMIT
 from symbolic_mcp.types import _ValidationResult
@@ -92,6 +96,59 @@ DANGEROUS_BUILTINS = frozenset(
 )
 
 
+# Attributes that expose class hierarchies, frames or globals for sandbox escapes
+_INTROSPECTION_ATTRS = frozenset(
+    {
+        "__subclasses__",
+        "__bases__",
+        "__mro__",
+        "__globals__",
+        "__class__",
+        "__code__",
+    }
+)
+
+
+# Source made only of blank and comment lines. Each line must end in exactly
+# one newline character so the match stays linear; NUL is left for compile()
+_COMMENT_ONLY_PATTERN = re.compile(
+    r"(?:[ \t\f]*(?:#[^\r\n\x00]*)?[\r\n])*[ \t\f]*(?:#[^\r\n\x00]*)?"
+)
+
+
+# Operator expressions that may wrap __builtins__, e.g. (__builtins__ or {})
+_OPERATOR_EXPR_TYPES = frozenset({ast.BinOp, ast.BoolOp, ast.Compare})
+
+
+def _attribute_chain(node: ast.Attribute) -> tuple[deque[str], ast.expr]:
+    """Split an attribute chain into its names and the expression it starts from.
+
+    For a.b.c this returns (deque(["b", "c"]), <Name a>).
+    """
+    parts = deque([node.attr])
+    root = node.value
+    while isinstance(root, ast.Attribute):
+        parts.appendleft(root.attr)
+        root = root.value
+    return parts, root
+
+
+class _BuiltinsFinder(ast.NodeVisitor):
+    """Find a reference to __builtins__ inside a single expression."""
+
+    def __init__(self) -> None:
+        self.found = False
+
+    def visit_Name(self, node: ast.Name) -> None:
+        if node.id == "__builtins__":
+            self.found = True
+
+    def generic_visit(self, node: ast.AST) -> None:
+        # Stop descending once a reference has been found
+        if not self.found:
+            super().generic_visit(node)
+
+
 class _DangerousCallVisitor(ast.NodeVisitor):
     """AST visitor that detects dangerous function calls and attribute access.
 
@@ -109,89 +166,101 @@ class _DangerousCallVisitor(ast.NodeVisitor):
     BLOCKED_GLOBALS = frozenset({"__builtins__"})
 
     def __init__(self) -> None:
-        self.dangerous_calls: list[str] = []
-        self.dangerous_references: list[str] = []
-        self.builtins_access: list[str] = []
-
-    def _is_dangerous_name(self, name: str) -> bool:
-        """Check if a name refers to a dangerous builtin."""
-        return name in DANGEROUS_BUILTINS
-
-    def _is_blocked_module(self, name: str) -> bool:
-        """Check if a name is a blocked module."""
-        return name in BLOCKED_MODULES
-
-    def _is_blocked_global(self, name: str) -> bool:
-        """Check if a name is a blocked global variable."""
-        return name in self.BLOCKED_GLOBALS
+        self.dangerous_calls: set[str] = set()
+        self.dangerous_references: set[str] = set()
+        self.builtins_access: set[str] = set()
+
+    def visit(self, node: ast.AST) -> None:
+        """Check every node under node in a single depth-first pass.
+
+        The walk keeps its own list stack instead of going through the
+        ast.walk() generator and deque, and visits nodes in source order.
+        Handlers are looked up by exact node type in _DISPATCH rather than
+        through NodeVisitor's per-node getattr, and do not recurse themselves.
+        The walk stops at the first node that records a dangerous call, since
+        any call already fails validation. References alone do not stop it,
+        because a later call takes precedence in the error message.
+        """
+        # Bind loop-invariant lookups to locals once per walk
+        get_handler = self._DISPATCH.get
+        iter_child_nodes = ast.iter_child_nodes
+        dangerous_calls = self.dangerous_calls
+        stack = [node]
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            child = pop()
+            handler = get_handler(type(child))
+            if handler is not None:
+                handler(self, child)
+                if dangerous_calls:
+                    return
+            # Push children reversed so they pop in source order and the
+            # first offending statement is the one reported
+            extend(reversed(list(iter_child_nodes(child))))
 
     def _check_subscript_for_dangerous(self, node: ast.Subscript) -> None:
         """Check if a subscript accesses a dangerous function.
 
         Handles: [eval][0](), (eval,)[0](), {"f": eval}["f"]()
         """
+        # Unwrap chained subscripts like [[eval]][0][0] without recursing
+        value = node.value
+        while type(value) is ast.Subscript:
+            value = value.value
+
         # Check the value being subscripted
-        if isinstance(node.value, ast.Name):
-            if self._is_dangerous_name(node.value.id):
-                self.dangerous_calls.append(node.value.id)
-        elif isinstance(node.value, (ast.List, ast.Tuple)):
-            self._check_sequence_for_dangerous(node.value)
-        elif isinstance(node.value, ast.Dict):
-            self._check_dict_for_dangerous(node.value)
-        elif isinstance(node.value, ast.Subscript):
-            self._check_subscript_for_dangerous(node.value)
+        if type(value) is ast.Name:
+            if value.id in DANGEROUS_BUILTINS:
+                self.dangerous_calls.add(value.id)
+        elif type(value) is ast.List or type(value) is ast.Tuple:
+            self._check_sequence_for_dangerous(value)
+        elif type(value) is ast.Dict:
+            self._check_dict_for_dangerous(value)
 
     def _check_sequence_for_dangerous(self, node: ast.List | ast.Tuple) -> None:
         """Check a list or tuple literal for dangerous builtin references.
 
-        Handles: [eval], (eval,), [[eval]]
+        Handles: [eval], (eval,). Nested literals such as [[eval]] are
+        reached by the walk in visit() and checked on their own.
         """
         for elt in node.elts:
-            if isinstance(elt, ast.Name) and self._is_dangerous_name(elt.id):
-                self.dangerous_calls.append(elt.id)
-                self.dangerous_references.append(elt.id)
-            elif isinstance(elt, (ast.List, ast.Tuple)):
-                self._check_sequence_for_dangerous(elt)
+            if type(elt) is ast.Name and elt.id in DANGEROUS_BUILTINS:
+                self.dangerous_calls.add(elt.id)
+                self.dangerous_references.add(elt.id)
 
     def _check_dict_for_dangerous(self, node: ast.Dict) -> None:
         """Check a dict literal for dangerous builtin references.
 
-        Handles: {"f": eval}, {"f": [eval]}
+        Handles: {"f": eval}. Literals nested in values such as {"f": [eval]}
+        are reached by the walk in visit() and checked on their own.
         """
         for value in node.values:
-            if isinstance(value, ast.Name) and self._is_dangerous_name(value.id):
-                self.dangerous_calls.append(value.id)
-                self.dangerous_references.append(value.id)
-            elif isinstance(value, (ast.List, ast.Tuple)):
-                self._check_sequence_for_dangerous(value)
-            elif isinstance(value, ast.Dict):
-                self._check_dict_for_dangerous(value)
+            if type(value) is ast.Name and value.id in DANGEROUS_BUILTINS:
+                self.dangerous_calls.add(value.id)
+                self.dangerous_references.add(value.id)
 
     def visit_List(self, node: ast.List) -> None:
         """Visit list nodes to detect dangerous function references."""
         self._check_sequence_for_dangerous(node)
-        self.generic_visit(node)
 
     def visit_Tuple(self, node: ast.Tuple) -> None:
         """Visit tuple nodes to detect dangerous function references."""
         self._check_sequence_for_dangerous(node)
-        self.generic_visit(node)
 
     def visit_Dict(self, node: ast.Dict) -> None:
         """Visit dict nodes to detect dangerous function references."""
         self._check_dict_for_dangerous(node)
-        self.generic_visit(node)
 
     def visit_Name(self, node: ast.Name) -> None:
         """Track dangerous names that might be called indirectly."""
         # If we see a dangerous name being referenced anywhere in the code,
         # it could be called indirectly
-        if self._is_dangerous_name(node.id):
-            self.dangerous_references.append(node.id)
+        if node.id in DANGEROUS_BUILTINS:
+            self.dangerous_references.add(node.id)
         # Check for blocked globals like __builtins__
-        if self._is_blocked_global(node.id):
-            self.dangerous_references.append(node.id)
-        self.generic_visit(node)
+        if node.id in self.BLOCKED_GLOBALS:
+            self.dangerous_references.add(node.id)
 
     def visit_Attribute(self, node: ast.Attribute) -> None:
         """Detect dangerous attribute access patterns.
@@ -203,36 +272,32 @@ class _DangerousCallVisitor(ast.NodeVisitor):
         - Introspection gadgets: __subclasses__, __bases__, __mro__, __globals__
         """
         # check for introspection gadgets
-        if node.attr in (
-            "__subclasses__",
-            "__bases__",
-            "__mro__",
-            "__globals__",
-            "__class__",
-            "__code__",
-        ):
-            self.dangerous_calls.append(f"introspection via {node.attr}")
+        if node.attr in _INTROSPECTION_ATTRS:
+            self.dangerous_calls.add(f"introspection via {node.attr}")
 
         # Check if this is accessing an attribute of __builtins__
         if isinstance(node.value, ast.Name):
             if node.value.id == "__builtins__":
                 # Block any attribute access to __builtins__
-                self.dangerous_calls.append(f"__builtins__.{node.attr}")
-                self.builtins_access.append(f"__builtins__.{node.attr}")
+                self.dangerous_calls.add(f"__builtins__.{node.attr}")
+                self.builtins_access.add(f"__builtins__.{node.attr}")
         # Also check nested attribute access like __builtins__.__dict__
         elif isinstance(node.value, ast.Attribute):
-            # Walk down to find the root
-            root: ast.expr = node.value
-            parts = [node.attr]
-            while isinstance(root, ast.Attribute):
-                parts.append(root.attr)
-                root = root.value
-            if isinstance(root, ast.Name) and root.id == "__builtins__":
-                parts.append("__builtins__")
-                full_chain = ".".join(reversed(parts))
-                self.dangerous_calls.append(full_chain)
-                self.builtins_access.append(full_chain)
-        self.generic_visit(node)
+            inner = node.value.value
+            if isinstance(inner, ast.Name):
+                # Two-level chain such as __builtins__.__dict__.get
+                if inner.id == "__builtins__":
+                    full_chain = f"__builtins__.{node.value.attr}.{node.attr}"
+                    self.dangerous_calls.add(full_chain)
+                    self.builtins_access.add(full_chain)
+            elif isinstance(inner, ast.Attribute):
+                # Walk down to find the root
+                parts, root = _attribute_chain(node)
+                if isinstance(root, ast.Name) and root.id == "__builtins__":
+                    parts.appendleft("__builtins__")
+                    full_chain = ".".join(parts)
+                    self.dangerous_calls.add(full_chain)
+                    self.builtins_access.add(full_chain)
 
     def visit_Subscript(self, node: ast.Subscript) -> None:
         """Detect dangerous subscript access patterns.
@@ -245,29 +310,17 @@ class _DangerousCallVisitor(ast.NodeVisitor):
         # Check if we're subscripting __builtins__
         if isinstance(node.value, ast.Name):
             if node.value.id == "__builtins__":
-                self.dangerous_calls.append("__builtins__[...]")
-                self.builtins_access.append("__builtins__[...]")
+                self.dangerous_calls.add("__builtins__[...]")
+                self.builtins_access.add("__builtins__[...]")
         # Check for subscripted expressions like (__builtins__)["eval"]
         # Use a targeted visitor instead of ast.walk to avoid O(n²) complexity
-        elif isinstance(node.value, (ast.BinOp, ast.BoolOp, ast.Compare)):
+        elif type(node.value) in _OPERATOR_EXPR_TYPES:
             # Check if __builtins__ appears in the expression using a visitor
-            class _BuiltinsFinder(ast.NodeVisitor):
-                def __init__(self) -> None:
-                    self.found = False
-
-                def visit_Name(self, n: ast.Name) -> None:
-                    if n.id == "__builtins__":
-                        self.found = True
-                    # Don't continue traversal if found
-                    if not self.found:
-                        self.generic_visit(n)
-
             finder = _BuiltinsFinder()
             finder.visit(node.value)
             if finder.found:
-                self.dangerous_calls.append("__builtins__[...]")
-                self.builtins_access.append("__builtins__[...]")
-        self.generic_visit(node)
+                self.dangerous_calls.add("__builtins__[...]")
+                self.builtins_access.add("__builtins__[...]")
 
     def visit_Call(self, node: ast.Call) -> None:
         """Detect dangerous function calls including getattr bypasses.
@@ -276,9 +329,14 @@ class _DangerousCallVisitor(ast.NodeVisitor):
         - getattr(__builtins__, "eval")
         - getattr(__builtins__, "exec")
         """
-        # Check for getattr(__builtins__, "dangerous")
-        if isinstance(node.func, ast.Name) and node.func.id == "getattr":
-            if len(node.args) >= 2:
+        func = node.func
+
+        # Direct name call: eval(), exec(), compile()
+        if type(func) is ast.Name:
+            if func.id in DANGEROUS_BUILTINS:
+                self.dangerous_calls.add(func.id)
+            # Check for getattr(__builtins__, "dangerous")
+            elif func.id == "getattr" and len(node.args) >= 2:
                 # First arg should be __builtins__
                 if (
                     isinstance(node.args[0], ast.Name)
@@ -287,52 +345,37 @@ class _DangerousCallVisitor(ast.NodeVisitor):
                     # Second arg is the attribute name - check if it's a dangerous builtin
                     if isinstance(node.args[1], ast.Constant):
                         attr_name = node.args[1].value
-                        if isinstance(attr_name, str) and self._is_dangerous_name(
-                            attr_name
+                        if (
+                            isinstance(attr_name, str)
+                            and attr_name in DANGEROUS_BUILTINS
                         ):
-                            self.dangerous_calls.append(
+                            self.dangerous_calls.add(
                                 f'getattr(__builtins__, "{attr_name}")'
                             )
                     # Even if we can't determine the attribute name statically,
                     # getattr on __builtins__ is dangerous
-                    self.dangerous_calls.append("getattr(__builtins__, ...)")
-                    self.builtins_access.append("getattr(__builtins__, ...)")
-
-        # Now check for other dangerous calls (original logic)
-        # Direct name call: eval(), exec(), compile()
-        if isinstance(node.func, ast.Name):
-            if self._is_dangerous_name(node.func.id):
-                self.dangerous_calls.append(node.func.id)
+                    self.dangerous_calls.add("getattr(__builtins__, ...)")
+                    self.builtins_access.add("getattr(__builtins__, ...)")
 
         # Attribute access: os.system(), subprocess.run()
-        elif isinstance(node.func, ast.Attribute):
+        elif type(func) is ast.Attribute:
             # Check for dangerous attribute chains
-            if isinstance(node.func.value, ast.Name):
+            if type(func.value) is ast.Name:
                 # module.dangerous_function()
-                attr_chain = f"{node.func.value.id}.{node.func.attr}"
-                if self._is_blocked_module(node.func.value.id):
-                    self.dangerous_calls.append(attr_chain)
-            elif isinstance(node.func.value, ast.Attribute):
+                if func.value.id in BLOCKED_MODULES:
+                    self.dangerous_calls.add(f"{func.value.id}.{func.attr}")
+            elif type(func.value) is ast.Attribute:
                 # nested.module.dangerous_function()
                 # Walk up to find the root module
-                root: ast.expr = node.func.value
-                parts = [node.func.attr]
-                while isinstance(root, ast.Attribute):
-                    parts.append(root.attr)
-                    root = root.value
+                parts, root = _attribute_chain(func)
                 if isinstance(root, ast.Name):
-                    parts.append(root.id)
-                    full_name = ".".join(reversed(parts))
-                    if any(
-                        self._is_blocked_module(part) for part in full_name.split(".")
-                    ):
-                        self.dangerous_calls.append(full_name)
+                    parts.appendleft(root.id)
+                    if not BLOCKED_MODULES.isdisjoint(parts):
+                        self.dangerous_calls.add(".".join(parts))
 
         # Subscript call: [eval][0]()
-        elif isinstance(node.func, ast.Subscript):
-            self._check_subscript_for_dangerous(node.func)
-
-        self.generic_visit(node)
+        elif type(func) is ast.Subscript:
+            self._check_subscript_for_dangerous(func)
 
     def visit_Import(self, node: ast.Import) -> None:
         """Check for blocked module imports.
@@ -340,13 +383,11 @@ class _DangerousCallVisitor(ast.NodeVisitor):
         This eliminates the need for a separate ast.walk() traversal
         in validate_code(), improving performance.
         """
-        if node.names:
-            module_name = node.names[0].name
-            if module_name:
-                base_module = module_name.split(".")[0]
-                if self._is_blocked_module(base_module):
-                    self.dangerous_calls.append(f"import {base_module}")
-        self.generic_visit(node)
+        # Check every alias: "import math, os" must not hide os behind math
+        for alias in node.names:
+            base_module = alias.name.partition(".")[0]
+            if base_module in BLOCKED_MODULES:
+                self.dangerous_calls.add(f"import {base_module}")
 
     def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
         """Check for blocked module imports in 'from X import Y' statements.
@@ -356,70 +397,153 @@ class _DangerousCallVisitor(ast.NodeVisitor):
         """
         # For ImportFrom, node.module can be None (relative imports)
         if node.module and node.names:
-            base_module = node.module.split(".")[0]
-            if self._is_blocked_module(base_module):
-                self.dangerous_calls.append(f"from {base_module} import ...")
-        self.generic_visit(node)
+            base_module = node.module.partition(".")[0]
+            if base_module in BLOCKED_MODULES:
+                self.dangerous_calls.add(f"from {base_module} import ...")
+
+    # Exact node type -> handler used by visit(); defined after the handlers
+    _DISPATCH: dict[type[ast.AST], Callable[["_DangerousCallVisitor", Any], None]] = {
+        ast.List: visit_List,
+        ast.Tuple: visit_Tuple,
+        ast.Dict: visit_Dict,
+        ast.Name: visit_Name,
+        ast.Attribute: visit_Attribute,
+        ast.Subscript: visit_Subscript,
+        ast.Call: visit_Call,
+        ast.Import: visit_Import,
+        ast.ImportFrom: visit_ImportFrom,
+    }
 
 
-def validate_code(code: str) -> _ValidationResult:
-    """Validate user code before execution.
+# Every name _DangerousCallVisitor keys on, so source containing none of
+# them cannot fail the AST checks. Built from the same sets the visitor
+# uses, so adding a name to any of them keeps the prescreen in step.
+_PRESCREEN_PATTERN = re.compile(
+    "|".join(
+        re.escape(token)
+        for token in sorted(
+            DANGEROUS_BUILTINS
+            | BLOCKED_MODULES
+            | _INTROSPECTION_ATTRS
+            | _DangerousCallVisitor.BLOCKED_GLOBALS
+        )
+    )
+)
 
-    Uses AST-based detection to prevent security bypasses:
-    - eval (1) - space before parenthesis
-    - getattr(__builtins__, "eval") - dynamic access
-    - [eval][0]() - list indexing bypass
-    - {"f": eval}["f"]() - dict lookup bypass
+
+def _parse_and_validate(
+    code: str,
+) -> tuple[_ValidationResult, ast.AST | None, str]:
+    """Validate user code and return the tree it was checked against.
+
+    Callers that go on to inspect the AST (logic_analyze_branches) reuse
+    this tree and its source instead of dedenting and parsing the same
+    request a second time.
 
     Returns:
-        ValidationResult with 'valid': bool and optional 'error': str if invalid
+        Tuple of the ValidationResult, the parsed module (None when the code
+        was rejected before or during parsing or was never parsed), and the
+        dedented source the module was parsed from. Whitespace-only and
+        comment-only code is returned as given, and "" when the code was
+        rejected before or during parsing
     """
     # Empty string edge case
-    if not code or not code.strip():
-        return {"valid": True}
+    if not code:
+        return {"valid": True}, ast.Module(body=[], type_ignores=[]), code
+
+    # Whitespace-only code is accepted unparsed. Characters such as \x0b or
+    # \u2028 are stripped here but rejected by the tokenizer, so only
+    # tokenizer whitespace gets an empty module in place of a parse
+    if not code.strip():
+        if _COMMENT_ONLY_PATTERN.fullmatch(code):
+            return {"valid": True}, ast.Module(body=[], type_ignores=[]), code
+        return {"valid": True}, None, code
 
     # Size limit check (configurable via SYMBOLIC_CODE_SIZE_LIMIT env var)
-    code_size = len(code.encode("utf-8"))
-    if code_size > CODE_SIZE_LIMIT:
+    # The UTF-8 size is at least the character count (exact for ASCII) and at
+    # most four bytes per character, so code is only encoded when those
+    # bounds cannot decide
+    char_count = len(code)
+    if char_count > CODE_SIZE_LIMIT or (
+        char_count * 4 > CODE_SIZE_LIMIT
+        and not code.isascii()
+        and len(code.encode("utf-8")) > CODE_SIZE_LIMIT
+    ):
         return {
             "valid": False,
             "error": f"Code size exceeds {CODE_SIZE_LIMIT // 1024}KB limit",
-        }
+        }, None, ""
+
+    # Comments cannot contain code, so there is nothing to parse or check
+    if _COMMENT_ONLY_PATTERN.fullmatch(code):
+        return {"valid": True}, ast.Module(body=[], type_ignores=[]), code
 
     # Check for blocked imports and dangerous function calls using AST
     # Use textwrap.dedent for consistency with _temporary_module and logic_analyze_branches
     # This allows users to pass indented code snippets (e.g., from markdown blocks)
+    source = textwrap.dedent(code)
     try:
-        tree = ast.parse(textwrap.dedent(code))
-
-        # First check for dangerous function calls
-        visitor = _DangerousCallVisitor()
-        visitor.visit(tree)
-
-        if visitor.dangerous_calls:
-            dangerous = ", ".join(set(visitor.dangerous_calls))
-            return {"valid": False, "error": f"Blocked function call: {dangerous}"}
-
-        # Check for dangerous function references in data structures
-        # These might not be called directly but are still dangerous
-        if visitor.dangerous_references:
-            # Filter out references that are already in dangerous_calls
-            refs = set(visitor.dangerous_references) - set(visitor.dangerous_calls)
-            if refs:
-                dangerous = ", ".join(refs)
-                return {
-                    "valid": False,
-                    "error": f"Blocked function reference: {dangerous}",
-                }
-
+        # Equivalent to ast.parse(source)
+        tree = compile(
+            source,
+            "<unknown>",
+            "exec",
+            flags=ast.PyCF_ONLY_AST,
+            dont_inherit=True,
+        )
     except SyntaxError as e:
         return {
             "valid": False,
             "error": f"Syntax error: {e}",
             "error_type": "SyntaxError",
-        }
+        }, None, ""
+
+    # Skip the visitor when no flagged name can occur. Non-ASCII source
+    # always takes the full path because identifiers are NFKC-normalized
+    # by the parser and may not appear verbatim in the text.
+    if code.isascii() and _PRESCREEN_PATTERN.search(code) is None:
+        return {"valid": True}, tree, source
+
+    # First check for dangerous function calls
+    visitor = _DangerousCallVisitor()
+    visitor.visit(tree)
+
+    if visitor.dangerous_calls:
+        dangerous = ", ".join(visitor.dangerous_calls)
+        return (
+            {"valid": False, "error": f"Blocked function call: {dangerous}"},
+            tree,
+            source,
+        )
+
+    # Check for dangerous function references in data structures
+    # These might not be called directly but are still dangerous
+    if visitor.dangerous_references:
+        # Filter out references that are already in dangerous_calls
+        refs = visitor.dangerous_references - visitor.dangerous_calls
+        if refs:
+            dangerous = ", ".join(refs)
+            return {
+                "valid": False,
+                "error": f"Blocked function reference: {dangerous}",
+            }, tree, source
+
+    return {"valid": True}, tree, source
+
+
+def validate_code(code: str) -> _ValidationResult:
+    """Validate user code before execution.
 
-    return {"valid": True}
+    Uses AST-based detection to prevent security bypasses:
+    - eval (1) - space before parenthesis
+    - getattr(__builtins__, "eval") - dynamic access
+    - [eval][0]() - list indexing bypass
+    - {"f": eval}["f"]() - dict lookup bypass
+
+    Returns:
+        ValidationResult with 'valid': bool and optional 'error': str if invalid
+    """
+    return _parse_and_validate(code)[0]
 
 
 __all__ = [
@@ -427,5 +551,6 @@ __all__ = [
     "BLOCKED_MODULES",
     "DANGEROUS_BUILTINS",
     "_DangerousCallVisitor",
+    "_parse_and_validate",
     "validate_code",
 ]
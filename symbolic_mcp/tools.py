@@ -9,14 +9,13 @@ MCP tool capabilities, exposed for testing.
 
 import ast
 import inspect
-import textwrap
 import time
 import types
 from typing import Optional
 
 from symbolic_mcp.analyzer import SymbolicAnalyzer, _temporary_module
 from symbolic_mcp.config import DEFAULT_ANALYSIS_TIMEOUT_SECONDS
-from symbolic_mcp.security import validate_code
+from symbolic_mcp.security import _parse_and_validate, validate_code
 from symbolic_mcp.types import (
     _BranchAnalysisResult,
     _BranchInfo,
@@ -309,8 +308,9 @@ def logic_analyze_branches(
     """
     start_time = time.perf_counter()
 
-    # Validate code first
-    validation = validate_code(code)
+    # Validate code first, keeping the dedented source and parsed tree for
+    # the branch walk
+    validation, tree, dedented_code = _parse_and_validate(code)
     if not validation["valid"]:
         return {
             "status": "error",
@@ -319,22 +319,23 @@ def logic_analyze_branches(
             "time_seconds": round(time.perf_counter() - start_time, 4),
         }
 
-    try:
-        tree = ast.parse(textwrap.dedent(code))
-    except SyntaxError as e:
-        result: _BranchAnalysisResult = {
-            "status": "error",
-            "error_type": "SyntaxError",
-            "message": str(e),
-        }
-        if e.lineno is not None:
-            result["line"] = e.lineno
-        return result
+    # Valid code comes back unparsed only when it is whitespace the
+    # tokenizer may still reject, so parse it here to report that
+    if tree is None:
+        try:
+            tree = ast.parse(dedented_code)
+        except SyntaxError as e:
+            result: _BranchAnalysisResult = {
+                "status": "error",
+                "error_type": "SyntaxError",
+                "message": str(e),
+            }
+            if e.lineno is not None:
+                result["line"] = e.lineno
+            return result
 
     # Use a single-pass visitor to collect both branches and complexity
     # This avoids multiple O(n) AST traversals
-    dedented_code = textwrap.dedent(code)
-
     class _BranchAndComplexityVisitor(ast.NodeVisitor):
         """Single-pass visitor that collects branches and calculates complexity."""
 
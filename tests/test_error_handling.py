@@ -31,7 +31,7 @@ SYNTAX_ERROR_CASES = [
     (
         "symbolic_check",
         lambda code: symbolic_check(
-            code=code, function_name="broken", timeout_seconds=5
+            code=code, function_name="broken", timeout_seconds=1
         ),
     ),
     (
@@ -40,7 +40,7 @@ SYNTAX_ERROR_CASES = [
             code=f"{code}\ndef good(x): return x",
             function_a="good",
             function_b="broken",
-            timeout_seconds=5,
+            timeout_seconds=1,
         ),
     ),
     (
@@ -49,7 +49,7 @@ SYNTAX_ERROR_CASES = [
             code=code,
             function_name="broken",
             exception_type="ValueError",
-            timeout_seconds=5,
+            timeout_seconds=1,
         ),
     ),
 ]
@@ -58,13 +58,13 @@ MISSING_FUNCTION_CASES = [
     (
         "symbolic_check",
         lambda code: symbolic_check(
-            code=code, function_name="nonexistent", timeout_seconds=5
+            code=code, function_name="nonexistent", timeout_seconds=1
         ),
     ),
     (
         "compare_functions",
         lambda code: compare_functions(
-            code=code, function_a="existing", function_b="missing", timeout_seconds=5
+            code=code, function_a="existing", function_b="missing", timeout_seconds=1
         ),
     ),
     (
@@ -73,7 +73,7 @@ MISSING_FUNCTION_CASES = [
             code=code,
             function_name="missing",
             exception_type="ValueError",
-            timeout_seconds=5,
+            timeout_seconds=1,
         ),
     ),
 ]
@@ -82,7 +82,7 @@ SANDBOX_VIOLATION_CASES = [
     (
         "symbolic_check",
         lambda code: symbolic_check(
-            code=code, function_name="restricted", timeout_seconds=5
+            code=code, function_name="restricted", timeout_seconds=1
         ),
     ),
     (
@@ -91,7 +91,7 @@ SANDBOX_VIOLATION_CASES = [
             code=f"{code}\ndef safe(x): return x",
             function_a="safe",
             function_b="restricted",
-            timeout_seconds=5,
+            timeout_seconds=1,
         ),
     ),
     (
@@ -100,7 +100,7 @@ SANDBOX_VIOLATION_CASES = [
             code=code,
             function_name="restricted",
             exception_type="ValueError",
-            timeout_seconds=5,
+            timeout_seconds=1,
         ),
     ),
 ]
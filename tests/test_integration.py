@@ -50,29 +50,57 @@ def tricky(x: int, y: int) -> int:
 # ============================================================================
 
 
-def test_find_path_to_exception() -> None:
-    """Test finding a path that raises a specific exception.
-
-    Given: A function that raises IndexError at x=123
-    When: find_path_to_exception is called
-    Then: The triggering input x=123 is found
-    """
-    code = """
+# Format: (code, function_name, exception_type, arg_name, expected_value)
+FOUND_EXCEPTION_CASES = [
+    (
+        """
 def unsafe(x: int) -> int:
     \"\"\"post: True\"\"\"
     if x == 123:
         raise IndexError("Boom")
     return x
+""",
+        "unsafe",
+        "IndexError",
+        "x",
+        123,
+    ),
+    (
+        """
+def divide(x: int, y: int) -> float:
+    return x / y
+""",
+        "divide",
+        "ZeroDivisionError",
+        "y",
+        0,
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "code,func_name,exception_type,arg_name,expected",
+    FOUND_EXCEPTION_CASES,
+    ids=["index_error", "division_by_zero"],
+)
+def test_find_path_to_exception(
+    code: str, func_name: str, exception_type: str, arg_name: str, expected: int
+) -> None:
+    """Test finding a path that raises a specific exception.
+
+    Given: A function that raises the exception for one specific input
+    When: find_path_to_exception is called
+    Then: The triggering input is found
     """
     result = logic_find_path_to_exception(
         code=code,
-        function_name="unsafe",
-        exception_type="IndexError",
+        function_name=func_name,
+        exception_type=exception_type,
         timeout_seconds=10,
     )
 
     assert result["status"] == "found"
-    assert result["triggering_inputs"][0]["args"]["x"] == 123
+    assert result["triggering_inputs"][0]["args"][arg_name] == expected
 
 
 def test_unreachable_exception() -> None:
@@ -215,6 +243,21 @@ def broken_syntax(x: int) -> int:
     assert result["status"] == "error"
 
 
+@pytest.mark.parametrize("code", ["\x0b", "\x1c"], ids=["vertical_tab", "file_sep"])
+def test_branch_analysis_rejects_non_python_whitespace(code: str) -> None:
+    """Test that whitespace the tokenizer rejects is reported as a syntax error.
+
+    Given: Code made only of characters str.strip() removes but Python rejects
+    When: analyze_branches is called
+    Then: A SyntaxError status with a line number is returned
+    """
+    result = logic_analyze_branches(code=code, function_name="f", timeout_seconds=1)
+
+    assert result["status"] == "error"
+    assert result["error_type"] == "SyntaxError"
+    assert result["line"] == 1
+
+
 def test_nonexistent_function() -> None:
     """Test handling of function that doesn't exist.
 
@@ -233,25 +276,3 @@ def existing_func(x: int) -> int:
     # analyze_branches handles missing functions gracefully by analyzing
     # the whole module - this is acceptable behavior
     assert result["status"] in ("complete", "error")
-
-
-def test_division_by_zero_detection() -> None:
-    """Test finding division by zero paths.
-
-    Given: A function that divides by a parameter
-    When: find_path_to_exception is called for ZeroDivisionError
-    Then: The path to y=0 is found
-    """
-    code = """
-def divide(x: int, y: int) -> float:
-    return x / y
-    """
-    result = logic_find_path_to_exception(
-        code=code,
-        function_name="divide",
-        exception_type="ZeroDivisionError",
-        timeout_seconds=10,
-    )
-
-    assert result["status"] == "found"
-    assert result["triggering_inputs"][0]["args"]["y"] == 0
@@ -5,14 +5,34 @@ registered and accessible.
 """
 
 from collections.abc import Callable
-from typing import Any, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol, cast
+
+import pytest
+
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
+
+
+@pytest.fixture(scope="module")
+def mcp() -> "FastMCP":
+    """Import the server lazily so collection does not build it."""
+    from symbolic_mcp import mcp as _mcp
+
+    return _mcp
+
+
+@pytest.fixture(scope="module")
+def resource_payloads(mcp: "FastMCP") -> dict[str, Any]:
+    """Call each registered resource function once per module."""
+    return {
+        uri: _get_mcp_resource_fn(mcp, uri)()
+        for uri in mcp._resource_manager._resources
+    }
 
-from symbolic_mcp import mcp
 
 # --- Type-safe helpers for FastMCP internal access ---
 
 
-@runtime_checkable
 class _HasCallableFn(Protocol):
     """Protocol for objects with a callable fn attribute.
 
@@ -28,24 +48,20 @@ def _get_mcp_resource_fn(mcp_instance: Any, uri: str) -> Callable[..., Any]:
     """Type-safe accessor for MCP resource function."""
     resource = mcp_instance._resource_manager._resources.get(uri)
     assert resource is not None, f"Resource {uri} not found"
-    assert isinstance(
-        resource, _HasCallableFn
-    ), f"Resource {uri} should have fn attribute"
-    return resource.fn
+    return cast(_HasCallableFn, resource).fn
 
 
 def _get_mcp_prompt_fn(mcp_instance: Any, name: str) -> Callable[..., Any]:
     """Type-safe accessor for MCP prompt function."""
     prompt = mcp_instance._prompt_manager._prompts.get(name)
     assert prompt is not None, f"Prompt {name} not found"
-    assert isinstance(prompt, _HasCallableFn), f"Prompt {name} should have fn attribute"
-    return prompt.fn
+    return cast(_HasCallableFn, prompt).fn
 
 
 class TestResources:
     """Tests verifying MCP Resources."""
 
-    def test_expected_resources_registered(self) -> None:
+    def test_expected_resources_registered(self, mcp: "FastMCP") -> None:
         """Verify that all expected resources are registered.
 
         Given: The MCP server is initialized
@@ -57,20 +73,21 @@ class TestResources:
             "config://server",
             "info://capabilities",
         }
-        actual_resources = set(mcp._resource_manager._resources.keys())  # type: ignore[attr-defined]
+        actual_resources = mcp._resource_manager._resources.keys()
         assert (
             actual_resources == expected_resources
-        ), f"Expected {expected_resources}, got {actual_resources}"
+        ), f"Expected {expected_resources}, got {set(actual_resources)}"
 
-    def test_security_resource_returns_correct_values(self) -> None:
+    def test_security_resource_returns_correct_values(
+        self, resource_payloads: dict[str, Any]
+    ) -> None:
         """Verify that security resource returns correct values.
 
         Given: The security resource is registered
         When: The resource function is called
         Then: It returns a dict with correct allowed/blocked modules
         """
-        resource_fn = _get_mcp_resource_fn(mcp, "config://security")
-        result = resource_fn()
+        result = resource_payloads["config://security"]
 
         assert isinstance(result, dict), "Security resource should return dict"
         assert "allowed_modules" in result
@@ -83,15 +100,16 @@ class TestResources:
         assert "eval" in result["dangerous_builtins"], "eval should be dangerous"
         assert "exec" in result["dangerous_builtins"], "exec should be dangerous"
 
-    def test_server_resource_returns_correct_values(self) -> None:
+    def test_server_resource_returns_correct_values(
+        self, resource_payloads: dict[str, Any]
+    ) -> None:
         """Verify that server resource returns correct values.
 
         Given: The server resource is registered
         When: The resource function is called
         Then: It returns a dict with server configuration
         """
-        resource_fn = _get_mcp_resource_fn(mcp, "config://server")
-        result = resource_fn()
+        result = resource_payloads["config://server"]
 
         assert isinstance(result, dict), "Server resource should return dict"
         assert "version" in result
@@ -105,15 +123,16 @@ class TestResources:
         ), "mask_error_details should be bool"
         assert isinstance(result["transport"], str), "transport should be string"
 
-    def test_capabilities_resource_returns_correct_values(self) -> None:
+    def test_capabilities_resource_returns_correct_values(
+        self, resource_payloads: dict[str, Any]
+    ) -> None:
         """Verify that capabilities resource returns correct values.
 
         Given: The capabilities resource is registered
         When: The resource function is called
         Then: It returns a dict with correct tool and resource counts
         """
-        resource_fn = _get_mcp_resource_fn(mcp, "info://capabilities")
-        result = resource_fn()
+        result = resource_payloads["info://capabilities"]
 
         assert isinstance(result, dict), "Capabilities resource should return dict"
         assert "tools" in result
@@ -133,11 +152,36 @@ class TestResources:
             tool_names == expected_tools
         ), f"Expected tools {expected_tools}, got {tool_names}"
 
+    def test_resource_payloads_match_contracts(
+        self, resource_payloads: dict[str, Any]
+    ) -> None:
+        """Verify that each resource returns exactly its TypedDict keys.
+
+        Given: The resource payloads are collected once per module
+        When: Their keys are compared to the result TypedDicts
+        Then: Each payload has exactly the declared keys
+        """
+        from symbolic_mcp.types import (
+            CapabilitiesResult,
+            SecurityConfigResult,
+            ServerConfigResult,
+        )
+
+        contracts: dict[str, Any] = {
+            "config://security": SecurityConfigResult,
+            "config://server": ServerConfigResult,
+            "info://capabilities": CapabilitiesResult,
+        }
+        for uri, contract in contracts.items():
+            assert (
+                resource_payloads[uri].keys() == contract.__required_keys__
+            ), f"Resource {uri} keys do not match {contract.__name__}"
+
 
 class TestPrompts:
     """Tests verifying MCP Prompts."""
 
-    def test_expected_prompts_registered(self) -> None:
+    def test_expected_prompts_registered(self, mcp: "FastMCP") -> None:
         """Verify that all expected prompts are registered.
 
         Given: The MCP server is initialized
@@ -150,24 +194,24 @@ class TestPrompts:
             "compare_functions_template",
             "analyze_branches_template",
         }
-        actual_prompts = set(mcp._prompt_manager._prompts.keys())  # type: ignore[attr-defined]
+        actual_prompts = mcp._prompt_manager._prompts.keys()
         assert (
             actual_prompts == expected_prompts
-        ), f"Expected {expected_prompts}, got {actual_prompts}"
+        ), f"Expected {expected_prompts}, got {set(actual_prompts)}"
 
-    def test_prompts_return_strings(self) -> None:
+    def test_prompts_return_strings(self, mcp: "FastMCP") -> None:
         """Verify that all prompts return strings.
 
         Given: Prompts are registered
         When: Each prompt function is called
         Then: It returns a string
         """
-        for name in mcp._prompt_manager._prompts.keys():  # type: ignore[attr-defined]
+        for name in mcp._prompt_manager._prompts.keys():
             prompt_fn = _get_mcp_prompt_fn(mcp, name)
             result = prompt_fn()
             assert isinstance(result, str), f"Prompt {name} should return str"
 
-    def test_prompt_contains_placeholders(self) -> None:
+    def test_prompt_contains_placeholders(self, mcp: "FastMCP") -> None:
         """Verify that prompts contain expected placeholders.
 
         Given: The symbolic_check_template prompt is registered
@@ -179,7 +223,7 @@ class TestPrompts:
         assert "{{code}}" in symbolic_check
         assert "{{function_name}}" in symbolic_check
 
-    def test_all_prompts_have_required_placeholders(self) -> None:
+    def test_all_prompts_have_required_placeholders(self, mcp: "FastMCP") -> None:
         """Verify all prompts have their required placeholders.
 
         Given: All prompts are registered
@@ -13,17 +13,32 @@ NOTE: These tests do NOT require CrossHair mocking. The validate_code function
 and the ALLOWED_MODULES/BLOCKED_MODULES constants have no CrossHair dependencies.
 """
 
+import ast
+
 import pytest
 
 from symbolic_mcp import (
     ALLOWED_MODULES,
     BLOCKED_MODULES,
+    CODE_SIZE_LIMIT,
     DANGEROUS_BUILTINS,
+    _parse_and_validate,
     validate_code,
 )
+from symbolic_mcp.security import (
+    _INTROSPECTION_ATTRS,
+    _PRESCREEN_PATTERN,
+    _DangerousCallVisitor,
+)
 
 pytestmark = pytest.mark.mocked
 
+# (module, code) pairs importing a blocked module
+DANGEROUS_IMPORT_CASES = tuple(
+    (module, f"import {module}\ndef foo(): pass")
+    for module in ("os", "sys", "subprocess", "pickle", "socket")
+)
+
 
 class TestValidation:
     """Consolidated validation tests."""
@@ -39,17 +54,12 @@ class TestValidation:
         for code, expected_in_error in dangerous_patterns:
             result = validate_code(code)
             assert result["valid"] is False, f"{expected_in_error} should be blocked"
-            assert (
-                "blocked" in result["error"].lower()
-                or expected_in_error in result["error"].lower()
-            )
+            error = result["error"].lower()
+            assert "blocked" in error or expected_in_error in error
 
     def test_blocks_dangerous_imports(self) -> None:
         """Test that dangerous module imports are blocked."""
-        dangerous_modules = ["os", "sys", "subprocess", "pickle", "socket"]
-
-        for module in dangerous_modules:
-            code = f"import {module}\ndef foo(): pass"
+        for module, code in DANGEROUS_IMPORT_CASES:
             result = validate_code(code)
             assert result["valid"] is False, f"{module} import should be blocked"
             assert module in result["error"] or "blocked" in result["error"].lower()
@@ -75,10 +85,8 @@ class TestValidation:
         # __import__ is definitely blocked
         result = validate_code('x = __import__("os")')
         assert result["valid"] is False, "__import__ should be blocked"
-        assert (
-            "__import__" in result["error"].lower()
-            or "blocked" in result["error"].lower()
-        )
+        error = result["error"].lower()
+        assert "__import__" in error or "blocked" in error
 
     def test_blocks_security_bypass_attempts(self) -> None:
         """Test that various security bypass attempts are blocked."""
@@ -90,6 +98,7 @@ class TestValidation:
             "(lambda: __builtins__.eval)('1+1')",  # Lambda wrapping
             '(__builtins__)["eval"]("1+1")',  # Parenthesized
             "(__builtins__ or {})['eval']('1+1')",  # Boolean operation
+            "\uff45val('1+1')",  # Fullwidth letter, NFKC-normalized to eval
         ]
 
         for bypass in bypass_attempts:
@@ -114,6 +123,7 @@ class Calculator:
 """,
             "import math\nresult = math.sqrt(16)",
             "# Comment about eval\ndef foo(): pass",
+            "# Only comments about eval\n\n    # import os\n",
         ]
 
         for code in safe_code_examples:
@@ -137,6 +147,44 @@ class Calculator:
                 expected_error in result["error"] or "error" in result["error"].lower()
             )
 
+    def test_enforces_code_size_limit_in_bytes(self) -> None:
+        """Test that the size limit counts UTF-8 bytes, not characters."""
+        padding = CODE_SIZE_LIMIT - len("x = ''")
+        assert validate_code("x = '" + "a" * padding + "'")["valid"] is True
+
+        for code in (
+            "x = '" + "a" * (padding + 1) + "'",
+            "x = '" + "\u00e9" * (padding // 2 + 1) + "'",  # 2 bytes per char
+        ):
+            result = validate_code(code)
+            assert result["valid"] is False
+            assert "size exceeds" in result["error"]
+
+    def test_parse_and_validate_returns_checked_tree(self) -> None:
+        """Test that the parsed tree is returned only when parsing succeeded."""
+        result, tree, source = _parse_and_validate(
+            "    def f(x):\n        return x\n"
+        )
+        assert result["valid"] is True
+        assert isinstance(tree, ast.Module)
+        assert isinstance(tree.body[0], ast.FunctionDef)
+        assert source == "def f(x):\n    return x\n"
+
+        result, tree, source = _parse_and_validate("def foo(\n")
+        assert result["valid"] is False
+        assert tree is None
+        assert source == ""
+
+    def test_reports_first_offending_statement(self) -> None:
+        """Test that the error names the first blocked statement in the source."""
+        result = validate_code("import os\nimport sys")
+        assert result["valid"] is False
+        assert "import os" in result["error"]
+
+        result = validate_code("x = subprocess.run('a')\ny = os.system('b')")
+        assert result["valid"] is False
+        assert "subprocess.run" in result["error"]
+
 
 class TestModuleConfiguration:
     """Tests for ALLOWED_MODULES and BLOCKED_MODULES configuration."""
@@ -169,3 +217,14 @@ class TestModuleConfiguration:
         assert "eval" in DANGEROUS_BUILTINS
         assert "exec" in DANGEROUS_BUILTINS
         assert "compile" in DANGEROUS_BUILTINS
+
+    def test_prescreen_matches_every_checked_name(self) -> None:
+        """Verify the prescreen cannot skip the visitor for any checked name."""
+        checked_names = (
+            DANGEROUS_BUILTINS
+            | BLOCKED_MODULES
+            | _INTROSPECTION_ATTRS
+            | _DangerousCallVisitor.BLOCKED_GLOBALS
+        )
+        for name in checked_names:
+            assert _PRESCREEN_PATTERN.search(name), f"Prescreen misses: {name}"